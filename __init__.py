@@ -5,6 +5,9 @@ Exports:
 - MCPInteractiveHTTPClient: interactive client using
   - streamable-http transport (mcp.run(transport="streamable-http"))
   - or SSE transport (mcp.run(transport="sse")), depending on the `transport` argument.
+- get_shared_client: cached, initialized client per (url, transport) for repeated
+  programmatic calls
+- close_shared_clients: close all shared clients on shutdown
 
 Defines:
 - MCPInteractiveHTTPClient:
@@ -20,6 +23,10 @@ Constructor:
         url: str,
         transport: str = "http",       # "http" (streamable-http) or "sse"
         activate_logger: bool = True,  # configure logging on first use if True
+        event_loop: str = "asyncio",   # "asyncio", "uvloop" or "uring" (Linux >= 5.11)
+        tools_ttl: float = 30.0,       # seconds to cache tools/list results
+        interactive: bool = True,      # False: no pretty-printing in call_tool
+        bulk_arguments: bool = False,  # True: one JSON prompt for all arguments
     )
 
 Example usage:
@@ -45,12 +52,31 @@ Example usage:
         ) as client:
             await client.run()
 
+    # programmatic usage: reuse one connection across many calls
+    from http_client import get_shared_client, close_shared_clients
+
+    async def main_batch():
+        client = await get_shared_client(HTTP_URL, transport="http")
+        try:
+            for city in ("Berlin", "Paris"):
+                await client.call_tool_by_name("get_weather", {"city": city})
+        finally:
+            await close_shared_clients()
+
     if __name__ == "__main__":
+        # optional: install uvloop (if available) before starting the loop
+        MCPInteractiveHTTPClient.use_uvloop()
         asyncio.run(main_http())
 """
 
-from .http_client import MCPInteractiveHTTPClient
+from .http_client import (
+    MCPInteractiveHTTPClient,
+    close_shared_clients,
+    get_shared_client,
+)
 
 __all__ = [
     "MCPInteractiveHTTPClient",
+    "get_shared_client",
+    "close_shared_clients",
 ]
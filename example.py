@@ -17,6 +17,9 @@ async def main_sse():
 
 
 if __name__ == "__main__":
+    # optional: faster event loop if uvloop is installed
+    MCPInteractiveHTTPClient.use_uvloop()
+
     transport = input(
         "Choose transport type:\n1: 'http' (streamable-http)\n2: 'sse' (Server-Sent Events)\nEnter 1 or 2: "
     )
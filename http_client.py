@@ -1,13 +1,295 @@
 import asyncio
+import functools
 import json
 import logging
+import os
+import re
+import sys
+import threading
+import time
 from logging_setup import setup_colored_logger
-from typing import Any, Dict, List, Optional, Callable
+from typing import Any, Callable, ClassVar, Dict, List, Literal, Optional, Tuple
 from mcp.client.streamable_http import streamable_http_client
 from mcp.client.sse import sse_client
 from mcp.client.session import ClientSession
 import mcp.types as types
 
+try:
+    # optional C JSON serializer for pretty-printing large tool results.
+    # User-entered arguments are always parsed with json.loads, which keeps
+    # integers beyond 64 bits exact and accepts NaN/Infinity.
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Escaped newlines become real newlines, all other backslashes are dropped
+_FINAL_RE = re.compile(r"\\n|\\")
+
+
+def _render_final(result_json_str: str) -> str:
+    """
+    Make a JSON string more readable in a single pass over the text.
+
+    :param result_json_str: Pretty-printed JSON string.
+    :return: Text with escaped newlines expanded and backslashes removed.
+    """
+    return _FINAL_RE.sub(
+        lambda m: "\n" if m.group() == "\\n" else "", result_json_str
+    )
+
+
+# accepted boolean CLI answers
+_TRUES = frozenset({"true", "1", "yes", "y"})
+_FALSES = frozenset({"false", "0", "no", "n"})
+
+
+def _parse_bool(value_str: str) -> bool:
+    """
+    Parse a boolean CLI answer (true/false, 1/0, yes/no, y/n).
+
+    :param value_str: Raw input string from the user.
+    :return: Parsed boolean.
+    :raises ValueError: If the input is not a recognized boolean.
+    """
+    lower = value_str.lower()
+    if lower in _TRUES:
+        return True
+    if lower in _FALSES:
+        return False
+    raise ValueError("Please enter true/false.")
+
+
+# JSON schema type -> accepted Python types of an already parsed JSON value
+_SCHEMA_PY_TYPES: Dict[str, Tuple[type, ...]] = {
+    "string": (str,),
+    "integer": (int,),
+    "number": (int, float),
+    "boolean": (bool,),
+    "array": (list,),
+    "object": (dict,),
+}
+
+
+def _matches_schema_type(prop_type: Any, value: Any) -> bool:
+    """
+    Check a parsed JSON value against a JSON schema type.
+
+    Unknown or compound types (e.g. ["string", "null"]) are not checked.
+
+    :param prop_type: JSON schema type of the property.
+    :param value: Parsed JSON value.
+    :return: True if the value matches (or the type is not checked).
+    """
+    if not isinstance(prop_type, str) or prop_type not in _SCHEMA_PY_TYPES:
+        return True
+    # bool is a subclass of int, but not a JSON integer/number
+    if isinstance(value, bool) and prop_type != "boolean":
+        return False
+    return isinstance(value, _SCHEMA_PY_TYPES[prop_type])
+
+
+def _json_parser(prop_type: str) -> Callable[[str], Any]:
+    """
+    Build a parser for JSON-valued schema types (array, object).
+
+    For arrays and objects we expect valid JSON from the user.
+    This keeps the CLI simple but allows complex arguments.
+
+    :param prop_type: JSON schema type, used in the error message.
+    :return: Callable parsing a raw input string as JSON.
+    """
+
+    def parse(value_str: str) -> Any:
+        try:
+            return json.loads(value_str)
+        except ValueError as e:
+            raise ValueError(f"Please enter valid JSON for {prop_type}: {e}") from e
+
+    return parse
+
+
+def _pretty(obj: Any) -> str:
+    """
+    Serialize an object to an indented JSON string (orjson if available).
+
+    Falls back to the stdlib encoder for values orjson rejects, e.g. integers
+    beyond 64 bits. The fallback keeps non-ASCII characters unescaped, like
+    orjson, so output does not depend on which encoder ran.
+
+    :param obj: JSON-serializable object.
+    :return: JSON string indented by two spaces.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+        except TypeError:
+            pass
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def _write_arguments(tool_name: str, arguments: Dict[str, Any]) -> None:
+    """
+    Print the arguments of a tool call (blocking; run by the output renderer).
+
+    :param tool_name: Name of the called tool.
+    :param arguments: Arguments passed to the tool.
+    :return: None
+    """
+    sys.stdout.write(
+        f"\nCalling tool '{tool_name}' with arguments:\n{_pretty(arguments)}\n"
+    )
+    sys.stdout.flush()
+
+
+def _write_result(result_dict: Dict[str, Any]) -> None:
+    """
+    Print a tool result as raw JSON and as readable "final" text (blocking; run by
+    the output renderer).
+
+    :param result_dict: Raw result dictionary from the tool call.
+    :return: None
+    """
+    # Written in parts with a single flush: raw and final text are never
+    # concatenated, so peak memory stays at the two strings themselves
+    out = sys.stdout
+    raw = _pretty(result_dict)
+    out.write("\n[TOOL RESULT (raw JSON)]\n")
+    out.write(raw)
+    out.write(
+        "\n\n[FINAL RESULT (rendered for readability, JSON formatting may be invalid)]\n"
+    )
+    out.write(_render_final(raw))
+    out.write("\n")
+    out.flush()
+
+
+# bytes read from stdin but not yet returned by `_ainput` (partial/extra lines)
+_STDIN_PENDING = bytearray()
+
+
+def _take_stdin_line(eof: bool = False) -> Optional[str]:
+    """
+    Pop one complete line from the pending stdin bytes.
+
+    :param eof: If True, return a trailing partial line as well.
+    :return: The line without trailing newline, or None if no line is complete.
+    """
+    idx = _STDIN_PENDING.find(b"\n")
+    if idx < 0:
+        if not eof or not _STDIN_PENDING:
+            return None
+        idx = len(_STDIN_PENDING)
+    line = bytes(_STDIN_PENDING[:idx])
+    del _STDIN_PENDING[: idx + 1]
+    return line.decode(sys.stdin.encoding or "utf-8", errors="replace").rstrip("\r")
+
+
+def _on_stdin_readable(fd: int, future: "asyncio.Future[str]") -> None:
+    """
+    Event loop reader callback: read available stdin bytes, resolve on a full line.
+
+    :param fd: File descriptor of stdin.
+    :param future: Future to resolve with the line (EOFError at end of input).
+    :return: None
+    """
+    if future.done():
+        return
+    try:
+        data = os.read(fd, 4096)
+    except OSError as e:
+        future.set_exception(e)
+        return
+
+    _STDIN_PENDING.extend(data)
+    line = _take_stdin_line(eof=not data)
+    if line is not None:
+        future.set_result(line)
+    elif not data:
+        future.set_exception(EOFError())
+
+
+def _in_daemon_thread(func: Callable[..., Any], *args: Any) -> "asyncio.Future[Any]":
+    """
+    Run a blocking callable in a fresh daemon thread and return a future for it.
+
+    Unlike the default executor, daemon threads are not joined when the event loop
+    shuts down, so a thread blocked on stdin/stdout never delays Ctrl-C / exit.
+
+    :param func: Blocking callable to run.
+    :param args: Positional arguments for `func`.
+    :return: Future resolved with the result (or exception) of `func`.
+    """
+    loop = asyncio.get_running_loop()
+    future: asyncio.Future[Any] = loop.create_future()
+
+    def resolve(result: Any, exc: Optional[BaseException]) -> None:
+        if future.done():
+            return
+        if exc is not None:
+            future.set_exception(exc)
+        else:
+            future.set_result(result)
+
+    def target() -> None:
+        result, exc = None, None
+        try:
+            result = func(*args)
+        except Exception as e:
+            exc = e
+        try:
+            loop.call_soon_threadsafe(resolve, result, exc)
+        except RuntimeError:
+            # event loop already closed (e.g. after Ctrl-C)
+            pass
+
+    threading.Thread(target=target, daemon=True).start()
+    return future
+
+
+async def _ainput(prompt: str = "") -> str:
+    """
+    Read a line from stdin without blocking the event loop.
+
+    For an interactive terminal on POSIX, stdin is watched with `loop.add_reader`,
+    so transport reader tasks (SSE / streamable-http) keep being scheduled while
+    the user types and Ctrl-C cancels the prompt immediately. Piped or redirected
+    input, and platforms without `add_reader` (Windows), are read via
+    `sys.stdin.readline` in a daemon thread instead (see `_in_daemon_thread`).
+
+    :param prompt: Prompt text printed before reading.
+    :raises EOFError: If stdin is closed.
+    :return: The line entered by the user, without trailing newline.
+    """
+    if prompt:
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+
+    line = _take_stdin_line()
+    if line is not None:
+        return line
+
+    loop = asyncio.get_running_loop()
+    future: asyncio.Future[str] = loop.create_future()
+    try:
+        # only a terminal delivers whole lines to the fd; for pipes, sys.stdin may
+        # already hold buffered data that reading the fd directly would skip
+        if not sys.stdin.isatty():
+            raise OSError("stdin is not a terminal")
+        fd = sys.stdin.fileno()
+        loop.add_reader(fd, _on_stdin_readable, fd, future)
+    except (AttributeError, NotImplementedError, OSError, ValueError):
+        # sys.stdin.readline keeps lines already buffered by an earlier input()
+        line = await _in_daemon_thread(sys.stdin.readline)
+        if not line:
+            raise EOFError
+        return line.rstrip("\r\n")
+
+    try:
+        return await future
+    finally:
+        loop.remove_reader(fd)
+
 
 class MCPInteractiveHTTPClient:
     """
@@ -29,6 +311,10 @@ class MCPInteractiveHTTPClient:
             url: str,
             transport: str = "http",       # "http" (streamable-http) or "sse"
             activate_logger: bool = True,  # configure logging on first use if True
+            event_loop: str = "asyncio",   # "asyncio", "uvloop" or "uring" (Linux >= 5.11)
+            tools_ttl: float = 30.0,       # seconds to cache tools/list results
+            interactive: bool = True,      # False: no pretty-printing in call_tool
+            bulk_arguments: bool = False,  # True: one JSON prompt for all arguments
         )
 
     Example usage:
@@ -55,14 +341,32 @@ class MCPInteractiveHTTPClient:
                 await client.run()
 
         if __name__ == "__main__":
+            # optional: install uvloop (if available) before starting the loop
+            MCPInteractiveHTTPClient.use_uvloop()
             asyncio.run(main_http())
     """
 
+    # logger for this class/module, shared by all instances
+    logger: ClassVar[logging.Logger] = logging.getLogger("MCPInteractiveHTTPClient")
+
+    # JSON schema type -> parser for raw CLI input; unknown types stay strings
+    _PARSERS: Dict[str, Callable[[str], Any]] = {
+        "integer": int,
+        "number": float,
+        "boolean": _parse_bool,
+        "array": _json_parser("array"),
+        "object": _json_parser("object"),
+    }
+
     def __init__(
         self,
         url: str,
         transport: str = "http",
         activate_logger: bool = True,
+        event_loop: Literal["asyncio", "uvloop", "uring"] = "asyncio",
+        tools_ttl: float = 30.0,
+        interactive: bool = True,
+        bulk_arguments: bool = False,
     ):
         """
         Initialize an interactive MCP client.
@@ -70,18 +374,43 @@ class MCPInteractiveHTTPClient:
         :param url: Base URL for the MCP endpoint (e.g. http://localhost:8000/mcp or /sse).
         :param transport: "http" for streamable-http, "sse" for SSE transport.
         :param activate_logger: If True, configure logging (info in green) on first instantiation.
+        :param event_loop: Event loop backend to install as asyncio policy:
+            "asyncio" (default), "uvloop" or "uring" (io_uring via uringcore,
+            Linux >= 5.11 only). Only installed if no event loop is running yet;
+            inside `asyncio.run(...)` it is ignored with a warning, so prefer
+            `use_event_loop(...)` before starting the loop.
+        :param tools_ttl: Seconds a tools/list result is reused by `list_tools`
+            before it is fetched again (0 disables caching).
+        :param interactive: If False, `call_tool` skips all pretty-printing; use
+            for programmatic / bulk automation without the CLI.
+        :param bulk_arguments: If True, `run` asks for all tool arguments at once
+            as a single JSON object instead of one prompt per property.
         """
         self.url = url
         self.transport = transport
+        self.interactive = interactive
+        self.bulk_arguments = bulk_arguments
         self._ctx = None
         self._read_stream = None
         self._write_stream = None
         # Callable that returns the session id (only set for streamable-http transport)
         self._get_session_id: Optional[Callable[[], str]] = None
         self._session: Optional[ClientSession] = None
-
-        # logger for this class/module
-        self.logger = logging.getLogger("MCPInteractiveHTTPClient")
+        # (monotonic timestamp, tools) of the last tools/list response
+        self._tools_cache: Optional[Tuple[float, List[types.Tool]]] = None
+        self._tools_ttl = tools_ttl
+        # name -> Tool index of the last tools/list response, for O(1) lookups
+        self._tools_by_name: Dict[str, types.Tool] = {}
+        # (tools list, rendered menu) memoized by `choose_tool`
+        self._menu_cache: Optional[Tuple[List[types.Tool], str]] = None
+        # server capabilities from the initialize handshake
+        self._server_capabilities: Optional[types.ServerCapabilities] = None
+        # resources prefetched by `run` alongside tools/list
+        self._resources: List[types.Resource] = []
+        # CLI output jobs drained by a background renderer task (see `_renderer`);
+        # None is the stop sentinel
+        self._out_queue: Optional[asyncio.Queue[Optional[Callable[[], None]]]] = None
+        self._renderer_task: Optional[asyncio.Task] = None
 
         # configure logging once
         if activate_logger:
@@ -90,6 +419,104 @@ class MCPInteractiveHTTPClient:
                 setup_colored_logger(logging.INFO)
             self.logger.info("Logger activated for MCPInteractiveHTTPClient")
 
+        self.event_loop = event_loop
+        if event_loop != "asyncio":
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                self._install_loop_policy(event_loop)
+            else:
+                # never swap the process-wide policy under a running loop
+                self.logger.warning(
+                    "Event loop already running; ignoring event_loop='%s' "
+                    "(call MCPInteractiveHTTPClient.use_event_loop() before "
+                    "asyncio.run)",
+                    event_loop,
+                )
+
+    @staticmethod
+    def _install_loop_policy(
+        event_loop: Literal["asyncio", "uvloop", "uring"],
+    ) -> bool:
+        """
+        Install the asyncio event loop policy for the requested backend.
+
+        Must be called before `asyncio.run(...)`. Unavailable backends fall back to
+        the default asyncio loop: a missing uvloop (an opportunistic speedup) is
+        logged at info level, an unusable io_uring backend at warning level.
+
+        - "asyncio": keep the current (default) policy
+        - "uvloop":  libuv-based loop (requires `uvloop`)
+        - "uring":   completion-driven io_uring loop (requires `uringcore`
+                     and Linux >= 5.11)
+
+        :param event_loop: Name of the backend to install.
+        :raises ValueError: If the backend name is unknown.
+        :return: True if a non-default policy was installed, False otherwise.
+        """
+        logger = MCPInteractiveHTTPClient.logger
+
+        if event_loop == "asyncio":
+            return False
+
+        if event_loop == "uvloop":
+            try:
+                import uvloop
+            except ImportError:
+                logger.info("uvloop not installed; using default asyncio event loop")
+                return False
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+            logger.info("Installed uvloop event loop policy")
+            return True
+
+        if event_loop == "uring":
+            if not sys.platform.startswith("linux"):
+                logger.warning(
+                    "io_uring event loop requires Linux; "
+                    "using default asyncio event loop"
+                )
+                return False
+            try:
+                import uringcore
+            except ImportError:
+                logger.warning(
+                    "uringcore not installed; using default asyncio event loop"
+                )
+                return False
+            asyncio.set_event_loop_policy(uringcore.EventLoopPolicy())
+            logger.info("Installed io_uring (uringcore) event loop policy")
+            return True
+
+        logger.error("Unknown event loop backend: '%s'", event_loop)
+        raise ValueError(f"Unknown event loop backend: {event_loop}")
+
+    @classmethod
+    def use_event_loop(
+        cls, event_loop: Literal["asyncio", "uvloop", "uring"]
+    ) -> bool:
+        """
+        Install the event loop policy for the given backend, if it is available.
+
+        Must be called before `asyncio.run(...)`.
+
+        :param event_loop: "asyncio", "uvloop" or "uring" (Linux >= 5.11).
+        :raises ValueError: If the backend name is unknown.
+        :return: True if a non-default policy was installed, False otherwise.
+        """
+        return cls._install_loop_policy(event_loop)
+
+    @classmethod
+    def use_uvloop(cls) -> bool:
+        """
+        Install uvloop as the asyncio event loop policy, if it is available.
+
+        Must be called before `asyncio.run(...)`. The client is purely network-I/O
+        bound, so the libuv-based loop lowers per-frame dispatch overhead.
+
+        :return: True if uvloop was installed, False if it is not available.
+        """
+        return cls.use_event_loop("uvloop")
+
     async def __aenter__(self) -> "MCPInteractiveHTTPClient":
         """
         Open the chosen transport and wrap it in a ClientSession.
@@ -128,6 +555,12 @@ class MCPInteractiveHTTPClient:
             self._session = ClientSession(self._read_stream, self._write_stream)
             await self._session.__aenter__()
             self.logger.info("ClientSession successfully entered")
+
+            if self.interactive:
+                # render CLI output in the background so slow stdout never stalls
+                # the transport reader tasks
+                self._out_queue = asyncio.Queue()
+                self._renderer_task = asyncio.create_task(self._renderer())
             return self
         except Exception as e:
             # include traceback for easier debugging
@@ -144,21 +577,73 @@ class MCPInteractiveHTTPClient:
         :return: None
         """
         self.logger.info("Closing interactive client")
+        self.invalidate_tools_cache()
+        try:
+            if self._renderer_task is not None:
+                # stop sentinel: pending output is written before the task ends
+                await self._out_queue.put(None)
+                await self._renderer_task
+        except Exception as e:
+            self.logger.error("Error while stopping output renderer: %s", e)
+        finally:
+            self._renderer_task = None
+            self._out_queue = None
+
         try:
             if self._session is not None:
                 await self._session.__aexit__(exc_type, exc, tb)
                 self.logger.info("ClientSession closed")
         except Exception as e:
-            self.logger.error("Error while closing ClientSession: %s", e, exc_info=True)
+            self.logger.error("Error while closing ClientSession: %s", e)
 
         try:
             if self._ctx is not None:
                 await self._ctx.__aexit__(exc_type, exc, tb)
                 self.logger.info("Transport context closed")
         except Exception as e:
-            self.logger.error(
-                "Error while closing transport context: %s", e, exc_info=True
-            )
+            self.logger.error("Error while closing transport context: %s", e)
+
+    async def _renderer(self) -> None:
+        """
+        Background task: run queued output jobs until the stop sentinel.
+
+        Each job (serializing / rendering and writing to stdout) runs in a daemon
+        thread, so the event loop keeps draining the transport while large results
+        are formatted or a slow terminal or pipe consumes the output.
+
+        :return: None
+        """
+        while True:
+            job = await self._out_queue.get()
+            try:
+                if job is None:
+                    return
+                await _in_daemon_thread(job)
+            except Exception as e:
+                self.logger.error("Failed to write CLI output: %s", e)
+            finally:
+                self._out_queue.task_done()
+
+    async def _emit(self, job: Callable[[], None]) -> None:
+        """
+        Queue an output job for the background renderer (run directly if none runs).
+
+        :param job: Blocking callable that formats and writes CLI output.
+        :return: None
+        """
+        if self._out_queue is None:
+            job()
+            return
+        await self._out_queue.put(job)
+
+    async def flush_output(self) -> None:
+        """
+        Wait until all queued CLI output has been written to stdout.
+
+        :return: None
+        """
+        if self._out_queue is not None:
+            await self._out_queue.join()
 
     async def initialize(self) -> None:
         """
@@ -172,32 +657,93 @@ class MCPInteractiveHTTPClient:
 
         self.logger.info("Initializing MCP session")
         try:
-            await self._session.initialize()
+            init_result = await self._session.initialize()
+            self._server_capabilities = init_result.capabilities
             self.logger.info("MCP session successfully initialized")
         except Exception as e:
-            self.logger.error("Initialize failed: %s", e, exc_info=True)
+            self.logger.error("Initialize failed: %s", e)
             raise
 
     async def list_tools(self) -> List[types.Tool]:
         """
         Fetch and return the list of available tools from the MCP server.
 
+        Results are cached for `tools_ttl` seconds to avoid repeated tools/list
+        round-trips; use `invalidate_tools_cache()` to force a refresh.
+
         :raises RuntimeError: If the session has not been started.
         :return: List of Tool objects provided by the MCP server.
         """
         if self._session is None:
             raise RuntimeError("Session not started")
 
+        if self._tools_cache is not None:
+            fetched_at, tools = self._tools_cache
+            if time.monotonic() - fetched_at < self._tools_ttl:
+                if self.logger.isEnabledFor(logging.INFO):
+                    self.logger.info("Using cached tools/list (%d tools)", len(tools))
+                return tools
+
         self.logger.info("Requesting tools/list")
         try:
             tools_result = await self._session.list_tools()
         except Exception as e:
-            self.logger.error("tools/list failed: %s", e, exc_info=True)
+            self.logger.error("tools/list failed: %s", e)
             raise
 
-        self.logger.info("Received %d tools", len(tools_result.tools))
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Received %d tools", len(tools_result.tools))
+        self._tools_cache = (time.monotonic(), tools_result.tools)
+        self._tools_by_name = {t.name: t for t in tools_result.tools}
         return tools_result.tools
 
+    def invalidate_tools_cache(self) -> None:
+        """
+        Drop the cached tools/list result so the next `list_tools` call refetches it.
+
+        :return: None
+        """
+        self._tools_cache = None
+        self._tools_by_name = {}
+        self._menu_cache = None
+
+    async def list_resources(self) -> List[types.Resource]:
+        """
+        Fetch and return the list of available resources from the MCP server.
+
+        :raises RuntimeError: If the session has not been started.
+        :return: List of Resource objects provided by the MCP server.
+        """
+        if self._session is None:
+            raise RuntimeError("Session not started")
+
+        self.logger.info("Requesting resources/list")
+        try:
+            resources_result = await self._session.list_resources()
+        except Exception as e:
+            self.logger.error("resources/list failed: %s", e)
+            raise
+
+        self.logger.info("Received %d resources", len(resources_result.resources))
+        self._resources = resources_result.resources
+        return resources_result.resources
+
+    async def _prefetch_resources(self) -> List[types.Resource]:
+        """
+        Best-effort resources/list for servers that advertise resources.
+
+        Failures are logged and yield an empty list, so they never break startup.
+
+        :return: List of Resource objects, or an empty list.
+        """
+        if self._server_capabilities is None or not self._server_capabilities.resources:
+            return []
+        try:
+            return await self.list_resources()
+        except Exception as e:
+            self.logger.warning("Skipping resources prefetch: %s", e)
+            return []
+
     async def list_tools_simple(self) -> List[str]:
         """
         Convenience method: return only the tool names as a simple list of strings.
@@ -207,7 +753,7 @@ class MCPInteractiveHTTPClient:
         tools = await self.list_tools()
         return [t.name for t in tools]
 
-    def choose_tool(self, tools: List[types.Tool]) -> Optional[types.Tool]:
+    async def choose_tool(self, tools: List[types.Tool]) -> Optional[types.Tool]:
         """
         Print the list of tools and let the user select one by number.
 
@@ -217,11 +763,20 @@ class MCPInteractiveHTTPClient:
         if not tools:
             return None
 
-        print("\nAvailable tools:")
-        for i, tool in enumerate(tools, start=1):
-            print(f"{i}. {tool.name} - {tool.description or ''}")
+        # the menu is rendered once per tools list (list_tools returns the same
+        # cached list object until the tools/list cache expires)
+        if self._menu_cache is not None and self._menu_cache[0] is tools:
+            menu = self._menu_cache[1]
+        else:
+            menu = "\n".join(
+                f"{i}. {tool.name} - {tool.description or ''}"
+                for i, tool in enumerate(tools, start=1)
+            )
+            self._menu_cache = (tools, menu)
+        sys.stdout.write(f"\nAvailable tools:\n{menu}\n")
+        sys.stdout.flush()
 
-        choice = input("\nSelect a tool by number: ").strip()
+        choice = (await _ainput("\nSelect a tool by number: ")).strip()
         try:
             idx = int(choice)
             if 1 <= idx <= len(tools):
@@ -249,29 +804,34 @@ class MCPInteractiveHTTPClient:
         :return: Parsed Python value.
         :raises ValueError: If parsing fails.
         """
-        if prop_type == "integer":
-            return int(value_str)
-        elif prop_type == "number":
-            return float(value_str)
-        elif prop_type == "boolean":
-            lower = value_str.lower()
-            if lower in ("true", "1", "yes", "y"):
-                return True
-            if lower in ("false", "0", "no", "n"):
-                return False
-            raise ValueError("Please enter true/false.")
-        elif prop_type in ("array", "object"):
-            # For arrays and objects we expect valid JSON from the user.
-            # This keeps the CLI simple but allows complex arguments.
-            try:
-                return json.loads(value_str)
-            except json.JSONDecodeError as e:
-                raise ValueError(f"Please enter valid JSON for {prop_type}: {e}") from e
-        else:
-            # default: treat as string
-            return value_str
+        # prop_type may be a list (e.g. ["string", "null"]), which is unhashable
+        parser = self._PARSERS.get(prop_type) if isinstance(prop_type, str) else None
+        # default: treat as string
+        return parser(value_str) if parser else value_str
+
+    def _print_schema_header(
+        self, tool: types.Tool
+    ) -> Tuple[Dict[str, Any], List[str]]:
+        """
+        Print the argument schema header for a tool and return its properties.
 
-    def prompt_arguments_for_tool(self, tool: types.Tool) -> Dict[str, Any]:
+        :param tool: Tool whose inputSchema should be shown.
+        :return: Tuple of (schema properties, required property names); the
+            properties are empty if the tool has no input schema.
+        """
+        input_schema = tool.inputSchema or {}
+        schema_props = input_schema.get("properties", {})
+        required = input_schema.get("required", [])
+
+        print(f"\nTool '{tool.name}' argument schema:")
+        if not schema_props:
+            print("  (no schema provided, using empty arguments {})")
+            self.logger.info(
+                "Tool '%s' has no input schema; using empty arguments", tool.name
+            )
+        return schema_props, required
+
+    async def prompt_arguments_for_tool(self, tool: types.Tool) -> Dict[str, Any]:
         """
         Prompt the user for argument values based on the tool's input schema.
 
@@ -284,36 +844,33 @@ class MCPInteractiveHTTPClient:
         :return: Dictionary of argument values keyed by property name.
         """
         name = tool.name
-        input_schema = tool.inputSchema or {}
-        schema_props = input_schema.get("properties", {})
-        required = input_schema.get("required", [])
-
-        print(f"\nTool '{name}' argument schema:")
+        schema_props, required = self._print_schema_header(tool)
         if not schema_props:
-            print("  (no schema provided, using empty arguments {})")
-            self.logger.info(
-                "Tool '%s' has no input schema; using empty arguments", name
-            )
             return {}
 
         arguments: Dict[str, Any] = {}
 
+        # build each prompt once; it is reused on every retry of a field
+        fields: List[Tuple[str, str, bool, str]] = []
         for prop_name, prop_def in schema_props.items():
             desc = prop_def.get("description", "")
             prop_type = prop_def.get("type", "string")
             is_required = prop_name in required
 
-            label = f"{prop_name} ({prop_type})"
+            parts = [f"{prop_name} ({prop_type})"]
             if desc:
-                label += f" - {desc}"
-            label += " [required]" if is_required else " [optional]"
-
+                parts.append(f" - {desc}")
+            parts.append(" [required]" if is_required else " [optional]")
             # for array/object
             if prop_type in ("array", "object"):
-                label += " (enter JSON value)"
+                parts.append(" (enter JSON value)")
+            parts.append(": ")
+
+            fields.append((prop_name, prop_type, is_required, "".join(parts)))
 
+        for prop_name, prop_type, is_required, prompt in fields:
             while True:
-                value_str = input(f"{label}: ").strip()
+                value_str = (await _ainput(prompt)).strip()
 
                 if not value_str:
                     if is_required:
@@ -343,6 +900,77 @@ class MCPInteractiveHTTPClient:
         self.logger.info("Collected arguments for tool '%s': '%s'", name, arguments)
         return arguments
 
+    async def prompt_arguments_bulk(self, tool: types.Tool) -> Dict[str, Any]:
+        """
+        Prompt the user once for all arguments as a single JSON object.
+
+        Faster alternative to `prompt_arguments_for_tool` for tools with many
+        properties: prints the schema, reads one line and parses it in one pass.
+        Keys are validated against the schema properties and "required" list,
+        values against the property's JSON schema type.
+        Used by `run` when the client is created with `bulk_arguments=True`.
+
+        :param tool: Tool whose inputSchema should be used to validate arguments.
+        :return: Dictionary of argument values keyed by property name.
+        """
+        name = tool.name
+        schema_props, required = self._print_schema_header(tool)
+        if not schema_props:
+            return {}
+
+        for prop_name, prop_def in schema_props.items():
+            desc = prop_def.get("description", "")
+            prop_type = prop_def.get("type", "string")
+            flag = "required" if prop_name in required else "optional"
+            line = f"  {prop_name} ({prop_type}) [{flag}]"
+            print(f"{line} - {desc}" if desc else line)
+
+        while True:
+            value_str = (await _ainput("Arguments (JSON object): ")).strip() or "{}"
+
+            try:
+                arguments = json.loads(value_str)
+            except ValueError as e:
+                print(f"Please enter a valid JSON object: {e}")
+                self.logger.warning("Invalid JSON arguments: '%s' (%s)", value_str, e)
+                continue
+
+            if not isinstance(arguments, dict):
+                print("Please enter a JSON object, e.g. {\"key\": \"value\"}.")
+                self.logger.warning("Arguments are not a JSON object: '%s'", value_str)
+                continue
+
+            unknown = [key for key in arguments if key not in schema_props]
+            missing = [prop for prop in required if prop not in arguments]
+            mistyped = [
+                key
+                for key, value in arguments.items()
+                if key in schema_props
+                and not _matches_schema_type(
+                    schema_props[key].get("type", "string"), value
+                )
+            ]
+            if unknown or missing or mistyped:
+                if unknown:
+                    print(f"Unknown arguments: {unknown}")
+                if missing:
+                    print(f"Missing required arguments: {missing}")
+                if mistyped:
+                    print(f"Arguments with wrong type: {mistyped}")
+                self.logger.warning(
+                    "Invalid arguments for '%s' (unknown=%s, missing=%s, mistyped=%s)",
+                    name,
+                    unknown,
+                    missing,
+                    mistyped,
+                )
+                continue
+
+            break
+
+        self.logger.info("Collected arguments for tool '%s': '%s'", name, arguments)
+        return arguments
+
     async def call_tool(
         self, tool: types.Tool, arguments: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -354,6 +982,9 @@ class MCPInteractiveHTTPClient:
         - prints raw JSON result
         - prints a slightly post-processed "final" result (mainly for readability)
 
+        Output is queued for the background renderer; use `flush_output()` to wait
+        until it has been written. With `interactive=False` nothing is printed.
+
         :param tool: Tool to call.
         :param arguments: Arguments dictionary to pass to the tool.
         :raises RuntimeError: If the session has not been started.
@@ -362,9 +993,10 @@ class MCPInteractiveHTTPClient:
         if self._session is None:
             raise RuntimeError("Session not started")
 
-        self.logger.info("Calling tool '%s'", tool.name)
-        print(f"\nCalling tool '{tool.name}' with arguments:")
-        print(json.dumps(arguments, indent=2))
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Calling tool '%s'", tool.name)
+        if self.interactive:
+            await self._emit(functools.partial(_write_arguments, tool.name, arguments))
 
         try:
             call_result = await self._session.call_tool(
@@ -373,23 +1005,14 @@ class MCPInteractiveHTTPClient:
             )
             result_dict = call_result.model_dump(mode="json")
         except Exception as e:
-            self.logger.error(
-                "Tool call for '%s' failed: %s", tool.name, e, exc_info=True
-            )
+            self.logger.error("Tool call for '%s' failed: %s", tool.name, e)
             raise
 
-        # Pretty-print raw JSON result
-        result_json_str = json.dumps(result_dict, indent=2)
-        print("\n[TOOL RESULT (raw JSON)]")
-        print(result_json_str)
+        if not self.interactive:
+            return result_dict
 
-        result_final = result_json_str.replace("\\n", "\n")
-        result_final = result_final.replace("\\", "")
-
-        print(
-            "\n[FINAL RESULT (rendered for readability, JSON formatting may be invalid)]"
-        )
-        print(result_final)
+        # serialization and rendering run in the renderer, off the event loop
+        await self._emit(functools.partial(_write_result, result_dict))
 
         return result_dict
 
@@ -401,16 +1024,35 @@ class MCPInteractiveHTTPClient:
 
         This method is intended for programmatic use without the interactive CLI.
         It does not print anything by itself, only logs.
+        For repeated calls, use a client from `get_shared_client(...)` to reuse
+        one open transport and initialized session instead of reconnecting.
+
+        If the tool is known from a previous `list_tools` call, required arguments
+        are checked locally before the request is sent.
 
         :param name: Tool name to call.
         :param arguments: Arguments dictionary to pass to the tool.
         :raises RuntimeError: If the session has not been started.
+        :raises ValueError: If required arguments of a known tool are missing.
         :return: Raw result dictionary from the tool call.
         """
         if self._session is None:
             raise RuntimeError("Session not started")
 
-        self.logger.info("Calling tool by name '%s' (non-interactive)", name)
+        tool = self._tools_by_name.get(name)
+        if tool is not None:
+            required = (tool.inputSchema or {}).get("required", [])
+            missing = [prop for prop in required if prop not in arguments]
+            if missing:
+                self.logger.error(
+                    "Missing required arguments for tool '%s': %s", name, missing
+                )
+                raise ValueError(
+                    f"Missing required arguments for tool '{name}': {missing}"
+                )
+
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Calling tool by name '%s' (non-interactive)", name)
         try:
             call_result = await self._session.call_tool(
                 name=name,
@@ -418,16 +1060,14 @@ class MCPInteractiveHTTPClient:
             )
             return call_result.model_dump(mode="json")
         except Exception as e:
-            self.logger.error(
-                "Non-interactive tool call for '%s' failed: %s", name, e, exc_info=True
-            )
+            self.logger.error("Non-interactive tool call for '%s' failed: %s", name, e)
             raise
 
     async def run(self) -> None:
         """
         High-level interactive loop:
         - initialize session
-        - list tools
+        - list tools (resources are prefetched concurrently, if supported)
         - repeatedly:
             * let user choose a tool
             * prompt for arguments
@@ -441,7 +1081,11 @@ class MCPInteractiveHTTPClient:
         """
         try:
             await self.initialize()
-            tools = await self.list_tools()
+            # initialize must complete first; afterwards independent requests
+            # share one round-trip of latency
+            tools, _ = await asyncio.gather(
+                self.list_tools(), self._prefetch_resources()
+            )
         except Exception as e:
             self.logger.error("Failed to start interactive loop: %s", e, exc_info=True)
             return
@@ -453,20 +1097,135 @@ class MCPInteractiveHTTPClient:
 
         while True:
             try:
-                chosen_tool = self.choose_tool(tools)
+                chosen_tool = await self.choose_tool(tools)
                 if chosen_tool is None:
                     # invalid selection, re-prompt
                     continue
 
-                arguments = self.prompt_arguments_for_tool(chosen_tool)
+                if self.bulk_arguments:
+                    arguments = await self.prompt_arguments_bulk(chosen_tool)
+                else:
+                    arguments = await self.prompt_arguments_for_tool(chosen_tool)
                 _ = await self.call_tool(chosen_tool, arguments)
+                # make sure the result is on screen before prompting again
+                await self.flush_output()
             except Exception as e:
                 self.logger.error(
                     "Error during interactive tool call: %s", e, exc_info=True
                 )
                 break
 
-            again = input("\nCall another tool? [y/n]: ").strip().lower()
+            again = (await _ainput("\nCall another tool? [y/n]: ")).strip().lower()
             if again in ("n", "no", ""):
                 self.logger.info("User chose to exit interactive loop")
                 break
+
+
+class _SharedClientOwner:
+    """
+    Owner task for one shared client.
+
+    The transport and ClientSession enter anyio task groups, which must be exited
+    by the task that entered them. The owner task enters the client, initializes
+    it and then waits for `stop`, so the client can be closed from any task.
+    """
+
+    def __init__(self, key: Tuple[str, str], client: MCPInteractiveHTTPClient):
+        self.key = key
+        self.client = client
+        self.loop = asyncio.get_running_loop()
+        # resolved with the client once initialized (or with the startup error)
+        self.ready: asyncio.Future[MCPInteractiveHTTPClient] = self.loop.create_future()
+        self.stop = asyncio.Event()
+        self.task = asyncio.create_task(self._own())
+        # drop the cache entry as soon as the owner ends (closed, failed, cancelled)
+        self.task.add_done_callback(self._forget)
+
+    def _forget(self, _task: "asyncio.Task[None]") -> None:
+        if _SESSIONS.get(self.key) is self:
+            del _SESSIONS[self.key]
+
+    def is_usable(self) -> bool:
+        """
+        Whether the owner still runs on the current event loop.
+
+        :return: False for owners that ended or belong to another (e.g. closed) loop.
+        """
+        return not self.task.done() and self.loop is asyncio.get_running_loop()
+
+    async def _own(self) -> None:
+        try:
+            async with self.client:
+                await self.client.initialize()
+                self.ready.set_result(self.client)
+                await self.stop.wait()
+        except asyncio.CancelledError:
+            self.ready.cancel()
+            raise
+        except Exception as e:
+            if not self.ready.done():
+                self.ready.set_exception(e)
+            else:
+                self.client.logger.error("Shared client failed: %s", e)
+
+
+# Shared client owners keyed by (url, transport), reused across programmatic calls
+_SESSIONS: Dict[Tuple[str, str], _SharedClientOwner] = {}
+
+
+async def get_shared_client(
+    url: str,
+    transport: str = "http",
+    activate_logger: bool = True,
+) -> MCPInteractiveHTTPClient:
+    """
+    Return a cached, already opened and initialized client for (url, transport).
+
+    The first call opens the transport and performs the MCP initialize handshake;
+    later calls reuse the same connection, so each `call_tool_by_name` costs a
+    single request/response round-trip. Shared clients are created with
+    `interactive=False`, so `call_tool` does not print either.
+
+    Concurrent first calls for the same key wait for a single handshake; calls for
+    other keys are not blocked by it. Each client is owned by a background task,
+    so `close_shared_clients()` may be called from any task.
+
+    :param url: Base URL for the MCP endpoint.
+    :param transport: "http" for streamable-http, "sse" for SSE transport.
+    :param activate_logger: Passed to the client constructor on first creation.
+    :return: Shared MCPInteractiveHTTPClient instance.
+    """
+    key = (url, transport)
+    owner = _SESSIONS.get(key)
+    if owner is None or not owner.is_usable():
+        # stale owners (from a previous asyncio.run, or already ended) are replaced
+        owner = _SharedClientOwner(
+            key,
+            MCPInteractiveHTTPClient(
+                url,
+                transport=transport,
+                activate_logger=activate_logger,
+                interactive=False,
+            )
+        )
+        _SESSIONS[key] = owner
+
+    # shield: a cancelled caller must not abort the handshake for the others.
+    # A failed startup is not cached: the owner's done callback drops the entry.
+    return await asyncio.shield(owner.ready)
+
+
+async def close_shared_clients() -> None:
+    """
+    Close all clients created via `get_shared_client` and clear the cache.
+
+    :return: None
+    """
+    loop = asyncio.get_running_loop()
+    owners = [owner for owner in _SESSIONS.values() if owner.loop is loop]
+    # owners of other (closed) loops cannot be awaited here; just forget them
+    _SESSIONS.clear()
+
+    for owner in owners:
+        owner.stop.set()
+    await asyncio.gather(*(owner.task for owner in owners), return_exceptions=True)
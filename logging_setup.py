@@ -1,4 +1,5 @@
 import logging
+from typing import Optional
 
 
 class ColorFormatter(logging.Formatter):
@@ -15,38 +16,53 @@ class ColorFormatter(logging.Formatter):
     RED = "\x1b[31m"
     RESET = "\x1b[0m"
 
+    # level -> color prefix, resolved with a single dict lookup per record
+    LEVEL_COLORS = {
+        logging.INFO: GREEN,
+        logging.WARNING: MAGENTA,
+        logging.ERROR: RED,
+        logging.CRITICAL: RED,
+    }
+
     def format(self, record: logging.LogRecord) -> str:
         msg = super().format(record)
 
-        if record.levelno == logging.INFO:
-            color = self.GREEN
-        elif record.levelno == logging.WARNING:
-            color = self.MAGENTA
-        elif record.levelno in (logging.ERROR, logging.CRITICAL):
-            color = self.RED
-        else:
-            color = ""
-
+        color = self.LEVEL_COLORS.get(record.levelno)
         if color:
             return f"{color}{msg}{self.RESET}"
         return msg
 
 
+# handler installed by setup_colored_logger; reused on subsequent calls
+_HANDLER: Optional[logging.Handler] = None
+
+
 def setup_colored_logger(level: int = logging.INFO) -> logging.Logger:
     """
     Configure root logger with ColorFormatter and return it.
 
+    The handler is created once; later calls only update the level, unless the
+    handler has been removed from the root logger in the meantime.
+
     Colors:
     - INFO    -> green
     - WARNING -> magenta
     - ERROR   -> red
     - CRITICAL-> red
     """
-    handler = logging.StreamHandler()
-    handler.setFormatter(ColorFormatter("[%(levelname)s] %(name)s: %(message)s"))
+    global _HANDLER
 
     root = logging.getLogger()
     root.setLevel(level)
+    if _HANDLER is not None and _HANDLER in root.handlers:
+        return root
+
+    if _HANDLER is None:
+        _HANDLER = logging.StreamHandler()
+        _HANDLER.setFormatter(
+            ColorFormatter("[%(levelname)s] %(name)s: %(message)s")
+        )
+
     root.handlers.clear()
-    root.addHandler(handler)
+    root.addHandler(_HANDLER)
     return root